@@ -4,3 +4,8 @@ set -euo pipefail
 pnpm test:physics
 pnpm test:posteriors
 pnpm test:reference
+
+# Transcript parsing/cache tests for scripts/timeline_activity.py (Python).
+# numba is included so the compiled scanner is checked against the regex path.
+uv run --with matplotlib --with numpy --with numba --with pytest \
+    pytest scripts/test_timeline_activity.py
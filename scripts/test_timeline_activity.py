@@ -0,0 +1,157 @@
+"""
+Regression tests for the transcript parsing in timeline_activity.py.
+
+Usage (also run by scripts/ci.sh):
+    uv run --with matplotlib --with numpy --with numba --with pytest \
+        pytest scripts/test_timeline_activity.py
+"""
+
+import os
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# The script isn't a package; import it from its own directory
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import timeline_activity as ta  # noqa: E402
+
+
+def scan(data):
+    return ta._scan_timestamps(data, 0, len(data))
+
+
+def test_nested_timestamp_keys_are_ignored():
+    data = (
+        b'{"toolUseResult": {"timestamp": "2020-01-01T00:00:00Z"}, "timestamp": "2026-01-16T14:30:00Z"}\n'
+        b'{"type": "file-history-snapshot", "snapshot": {"timestamp": "2020-01-01T00:00:00Z"}}\n'
+        b'{"message": "{ [ \\"timestamp\\": \\"x\\"", "timestamp": "2026-01-16T14:31:00.5Z"}\n'
+        b'{"timestamp": "2026-01-16T14:32:00Z", "payload": {"timestamp": "2020-01-01T00:00:00Z"}}\n'
+    )
+    expected = np.array(
+        ['2026-01-16T14:30:00', '2026-01-16T14:31:00.5', '2026-01-16T14:32:00'],
+        dtype='datetime64[ns]')
+    np.testing.assert_array_equal(scan(data), expected)
+
+
+class CountingPattern:
+    """Wraps a compiled pattern and counts the bytes passed to sub()."""
+
+    def __init__(self, pattern):
+        self.pattern = pattern
+        self.scanned = 0
+
+    def sub(self, repl, string):
+        self.scanned += len(string)
+        return self.pattern.sub(repl, string)
+
+
+def test_long_line_with_many_nested_keys_is_scanned_once(monkeypatch):
+    monkeypatch.setattr(ta, 'njit', None)
+    counting = CountingPattern(ta._JSON_STR_RE)
+    monkeypatch.setattr(ta, '_JSON_STR_RE', counting)
+    nested = b','.join(
+        b'{"timestamp": "2020-01-01T00:00:00Z", "content": "%s"}' % (b'x' * 200)
+        for _ in range(3000))
+    line = b'{"toolUseResult": [' + nested + b'], "timestamp": "2026-01-16T14:30:00Z"}\n'
+
+    result = scan(line)
+    np.testing.assert_array_equal(result, np.array(['2026-01-16T14:30:00'], dtype='datetime64[ns]'))
+    assert counting.scanned <= len(line)
+
+
+def test_offsets_and_malformed_values_in_a_large_batch():
+    lines = [b'{"timestamp": "2026-01-16T14:30:%02d.123Z"}' % (i % 60) for i in range(1000)]
+    lines += [
+        b'{"timestamp": "2026-01-16T16:30:00+02:00"}',
+        b'{"timestamp": "garbage"}',
+        b'{"timestamp": "2026-02-30T00:00:00Z"}',
+    ]
+    result = scan(b'\n'.join(lines) + b'\n')
+    assert len(result) == 1001
+    assert np.datetime64('2026-01-16T14:30:00', 'ns') in result
+    assert result.max() == np.datetime64('2026-01-16T14:30:59.123', 'ns')
+    assert (result == np.datetime64('2026-01-16T14:30:00', 'ns')).sum() == 1
+
+
+def test_invalid_date_only_falls_back_for_that_value(monkeypatch):
+    values = [b'2026-01-16T14:30:%02d' % (i % 60) for i in range(1000)]
+    values.insert(500, b'2026-02-30T00:00:00')
+    fallback = []
+    monkeypatch.setattr(ta, 'parse_timestamp', lambda ts: fallback.append(ts))
+
+    parsed, invalid = ta._cast_naive_iso(values)
+    assert len(parsed) == 1000
+    assert invalid == [b'2026-02-30T00:00:00']
+
+    lines = [b'{"timestamp": "%sZ"}' % value for value in values]
+    assert len(scan(b'\n'.join(lines) + b'\n')) == 1000
+    assert fallback == ['2026-02-30T00:00:00']
+
+
+def test_numba_scanner_matches_regex_path(monkeypatch):
+    pytest.importorskip('numba')
+    rng = random.Random(0)
+    templates = [
+        b'{"message": {"content": "x { [ \\"timestamp\\": 1"}, "toolUseResult": {"timestamp": "2020-01-01T00:00:00Z"}, "timestamp": "%s"}',
+        b'{"timestamp": "%s", "type": "event_msg", "payload": {"timestamp": "2020-01-01T00:00:00Z"}}',
+        b'{"type": "file-history-snapshot", "snapshot": {"timestamp": "%s"}}',
+        b'{"a": [{"timestamp": "2020-01-01T00:00:00Z"}], "timestamp": null}',
+    ]
+    values = ['2026-01-16T14:%02d:%02d.%03dZ', '2026-01-16 14:%02d:%02d.%06d',
+              '2026-01-16T14:%02d:%02d.%03d+02:00', '2026-02-30T14:%02d:%02d.%03d']
+    lines = []
+    for _ in range(5000):
+        template = rng.choice(templates)
+        if b'%s' in template:
+            value = rng.choice(values) % (rng.randrange(60), rng.randrange(60), rng.randrange(1000))
+            template = template % value.encode()
+        lines.append(template)
+    data = b'\n'.join(lines)
+
+    monkeypatch.setattr(ta, '_NUMBA_MIN_BYTES', 0)
+    compiled = np.sort(scan(data))
+    monkeypatch.setattr(ta, 'njit', None)
+    reference = np.sort(scan(data))
+    assert len(reference) > 1500
+    np.testing.assert_array_equal(compiled, reference)
+
+
+@pytest.mark.parametrize('contents', [b'', b'PK\x03\x04truncated', b'not a cache'])
+def test_corrupted_cache_entries_are_ignored(tmp_path, monkeypatch, contents):
+    monkeypatch.setattr(ta, '_CACHE_DIR', tmp_path / 'cache')
+    transcript = tmp_path / 'session.jsonl'
+    transcript.write_bytes(b'{"timestamp": "2026-01-16T14:30:00Z"}\n')
+    ta._CACHE_DIR.mkdir()
+    ta._cache_path(transcript).write_bytes(contents)
+
+    result = ta.extract_timestamps(transcript)
+    np.testing.assert_array_equal(result, np.array(['2026-01-16T14:30:00'], dtype='datetime64[ns]'))
+    assert ta._load_cache(transcript) is not None
+
+
+def test_cache_from_another_version_is_ignored(tmp_path, monkeypatch):
+    monkeypatch.setattr(ta, '_CACHE_DIR', tmp_path / 'cache')
+    transcript = tmp_path / 'session.jsonl'
+    transcript.write_bytes(b'{"timestamp": "2026-01-16T14:30:00Z"}\n')
+    ta.extract_timestamps(transcript)
+    assert ta._load_cache(transcript) is not None
+
+    monkeypatch.setattr(ta, '_CACHE_VERSION', ta._CACHE_VERSION + 1)
+    assert ta._load_cache(transcript) is None
+
+
+def test_same_size_rewrite_is_reparsed(tmp_path, monkeypatch):
+    monkeypatch.setattr(ta, '_CACHE_DIR', tmp_path / 'cache')
+    transcript = tmp_path / 'session.jsonl'
+    tail = b'{"type": "padding", "content": "%s"}\n' % (b'x' * 100)
+    transcript.write_bytes(b'{"timestamp": "2026-01-16T14:30:00Z"}\n' + tail)
+    ta.extract_timestamps(transcript)
+    mtime_ns = transcript.stat().st_mtime_ns
+
+    transcript.write_bytes(b'{"timestamp": "2027-01-16T14:30:00Z"}\n' + tail)
+    os.utime(transcript, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+    result = ta.extract_timestamps(transcript)
+    np.testing.assert_array_equal(result, np.array(['2027-01-16T14:30:00'], dtype='datetime64[ns]'))
@@ -10,6 +10,9 @@ Usage:
     # Without config (uses hardcoded SESSIONS below)
     uv run --with matplotlib --with numpy scripts/timeline_activity.py
 
+    # Optional: numba speeds up parsing of large transcripts
+    uv run --with matplotlib --with numpy --with numba scripts/timeline_activity.py timeline_config.json
+
 Output:
     docs/timeline_activity.png
     docs/timeline_activity.svg
@@ -18,206 +21,549 @@ The script reads JSONL transcript files from ~/.claude and ~/.codex directories,
 extracts timestamps, and creates a visualization showing actual activity patterns.
 """
 
+import hashlib
 import json
+import mmap
+import os
+import re
 import sys
+import zipfile
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
+from matplotlib.collections import PolyCollection
+from matplotlib.colors import to_rgba
 from matplotlib.patches import Patch
 import numpy as np
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional
+    njit = None
+
 # Colors for each agent type
 CLAUDE_COLOR = "#6366f1"  # indigo
 CODEX_COLOR = "#f97316"   # orange
 
+# Plot sections from bottom to top; sessions of any other type are skipped
+SESSION_TYPES = ("codex", "claude")
+
+# Per-session plotting metadata; timestamps are sorted, so start/end are the
+# first/last entries
+SessionMeta = namedtuple("SessionMeta", ["name", "type", "timestamps", "start", "end"])
+
+# Resolution of the PNG output; also bounds how many event lines are visible
+PNG_DPI = 150
+# Event lines kept per pixel column; a few overlapping alpha=0.6 lines are
+# already visually opaque, so anything beyond that is pure overdraw
+LINES_PER_PIXEL = 4
+
+# Number of density bins per session: up to TARGET_BINS bins of at least one
+# minute each, but never fewer than MIN_BINS
+TARGET_BINS = 30
+MIN_BINS = 10
+
+# Python 3.11+ fromisoformat accepts the Z suffix and any fractional precision
+_FROMISO_HANDLES_Z = sys.version_info >= (3, 11)
+_FRAC_RE = re.compile(r'(\.\d{6})\d+')
+
+# Only the top-level timestamp field is needed, so scan the raw file instead of
+# json.loads. Nested objects (toolUseResult, snapshot, ...) can carry their own
+# timestamp keys, so each match is checked for nesting depth before it is used.
+# A trailing Z is left out of the group so NumPy can parse the value as UTC.
+_TS_RE = re.compile(rb'"timestamp"\s*:\s*"([^"\n]+?)Z?"')
+_JSON_STR_RE = re.compile(rb'"(?:[^"\\\n]|\\.)*"')
+# Values NumPy can parse as naive UTC; anything else goes through parse_timestamp
+_NAIVE_ISO_RE = re.compile(rb'\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:\.\d+)?')
+
+_HOME = Path.home()
+
+# Parsed timestamps are cached per transcript; transcripts are append-only, so a
+# grown file only needs its new tail parsed.
+_CACHE_DIR = _HOME / ".cache" / "timeline_activity"
+_CACHE_CHECK_BYTES = 64
+# Bump whenever the parsing logic changes so stale cache entries are ignored
+_CACHE_VERSION = 2
+
+# Regions larger than this use the numba parser when available; below it the
+# JIT warmup isn't worth it
+_NUMBA_MIN_BYTES = 1 << 20
+_TS_KEY = np.frombuffer(b'"timestamp"', dtype=np.uint8)
+_DAYS_IN_MONTH = np.array([31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31], dtype=np.int64)
+
 # Session definitions with their transcript paths and metadata
 SESSIONS = {
     "Claude Code #1": {
-        "path": Path.home() / ".claude/projects/-Users-stefansko-conductor-workspaces-jax-js-mcmc-lyon/0b9b0665-46df-40fd-b2d0-10df07d451b3.jsonl",
+        "path": _HOME / ".claude/projects/-Users-stefansko-conductor-workspaces-jax-js-mcmc-lyon/0b9b0665-46df-40fd-b2d0-10df07d451b3.jsonl",
         "type": "claude",
     },
     "Claude Code #2": {
-        "path": Path.home() / ".claude/projects/-Users-stefansko-conductor-workspaces-jax-js-mcmc-kyoto/4045d60b-5016-4c3b-b25d-9174ef216086.jsonl",
+        "path": _HOME / ".claude/projects/-Users-stefansko-conductor-workspaces-jax-js-mcmc-kyoto/4045d60b-5016-4c3b-b25d-9174ef216086.jsonl",
         "type": "claude",
     },
     "Claude Code #2.2": {
-        "path": Path.home() / ".claude/projects/-Users-stefansko-conductor-workspaces-jax-js-mcmc-kyoto/d87c1e7e-bfb3-473b-9f11-ec436618f965.jsonl",
+        "path": _HOME / ".claude/projects/-Users-stefansko-conductor-workspaces-jax-js-mcmc-kyoto/d87c1e7e-bfb3-473b-9f11-ec436618f965.jsonl",
         "type": "claude",
     },
     "Claude Code #4": {
-        "path": Path.home() / ".claude/projects/-Users-stefansko-conductor-workspaces-jax-js-mcmc-cairo/3d2b0069-5075-488e-9614-ad30db3f8c9b.jsonl",
+        "path": _HOME / ".claude/projects/-Users-stefansko-conductor-workspaces-jax-js-mcmc-cairo/3d2b0069-5075-488e-9614-ad30db3f8c9b.jsonl",
         "type": "claude",
     },
     "Claude Code #6": {
-        "path": Path.home() / ".claude/projects/-Users-stefansko-jax-js-mcmc/c2f46c1d-6ecd-4e41-a0af-d1ca3b2cf4e8.jsonl",
+        "path": _HOME / ".claude/projects/-Users-stefansko-jax-js-mcmc/c2f46c1d-6ecd-4e41-a0af-d1ca3b2cf4e8.jsonl",
         "type": "claude",
     },
     "Codex #2.1": {
-        "path": Path.home() / ".codex/sessions/2026/01/17/rollout-2026-01-17T00-08-07-019bc910-e873-7f91-b5e9-659c99dfa485.jsonl",
+        "path": _HOME / ".codex/sessions/2026/01/17/rollout-2026-01-17T00-08-07-019bc910-e873-7f91-b5e9-659c99dfa485.jsonl",
         "type": "codex",
     },
     "Codex #3": {
-        "path": Path.home() / ".codex/sessions/2026/01/16/rollout-2026-01-16T16-46-56-019bc77d-000e-7252-99f9-f3d45926c791.jsonl",
+        "path": _HOME / ".codex/sessions/2026/01/16/rollout-2026-01-16T16-46-56-019bc77d-000e-7252-99f9-f3d45926c791.jsonl",
         "type": "codex",
     },
     "Codex #3.1": {
-        "path": Path.home() / ".codex/sessions/2026/01/16/rollout-2026-01-16T23-53-58-019bc903-f3de-71f0-bbff-67bd1983c4b3.jsonl",
+        "path": _HOME / ".codex/sessions/2026/01/16/rollout-2026-01-16T23-53-58-019bc903-f3de-71f0-bbff-67bd1983c4b3.jsonl",
         "type": "codex",
     },
     "Codex #5a": {
-        "path": Path.home() / ".codex/sessions/2026/01/16/rollout-2026-01-16T23-25-23-019bc8e9-c9b9-7b80-9906-aed4c2a8027b.jsonl",
+        "path": _HOME / ".codex/sessions/2026/01/16/rollout-2026-01-16T23-25-23-019bc8e9-c9b9-7b80-9906-aed4c2a8027b.jsonl",
         "type": "codex",
     },
     "Codex #5b": {
-        "path": Path.home() / ".codex/sessions/2026/01/17/rollout-2026-01-17T00-38-20-019bc92c-9234-7c31-b59e-0937c69da930.jsonl",
+        "path": _HOME / ".codex/sessions/2026/01/17/rollout-2026-01-17T00-38-20-019bc92c-9234-7c31-b59e-0937c69da930.jsonl",
         "type": "codex",
     },
 }
 
 
 def parse_timestamp(ts_str):
-    """Parse ISO timestamp string to datetime."""
+    """Parse ISO timestamp string to a naive UTC datetime."""
     if not ts_str:
         return None
+    if not _FROMISO_HANDLES_Z:
+        # Older Pythons: normalize Z suffix and truncate to microseconds
+        ts_str = _FRAC_RE.sub(r'\1', ts_str.replace('Z', '+00:00'))
     try:
-        # Handle Z suffix
-        if ts_str.endswith('Z'):
-            ts_str = ts_str[:-1] + '+00:00'
-        # Handle milliseconds
-        if '.' in ts_str and '+' in ts_str:
-            base, tz = ts_str.rsplit('+', 1)
-            if '.' in base:
-                main, frac = base.split('.')
-                frac = frac[:6]  # Truncate to microseconds
-                ts_str = f"{main}.{frac}+{tz}"
-        return datetime.fromisoformat(ts_str)
-    except Exception as e:
+        ts = datetime.fromisoformat(ts_str)
+    except (ValueError, TypeError):
         return None
+    # datetime64 has no timezone, so normalize aware values to UTC
+    if ts.tzinfo is not None:
+        ts = ts.astimezone(timezone.utc).replace(tzinfo=None)
+    return ts
 
 
-def extract_timestamps(path):
-    """Extract all timestamps from a JSONL transcript file."""
+def _cache_path(path):
+    """Return the cache file for a transcript path."""
+    key = hashlib.blake2b(str(path).encode(), digest_size=8).hexdigest()
+    return _CACHE_DIR / f"{key}.npz"
+
+
+def _load_cache(path):
+    """Load the cached parse of a transcript, or None if missing/stale/unreadable."""
+    try:
+        with np.load(_cache_path(path)) as cached:
+            if int(cached['version']) != _CACHE_VERSION:
+                return None
+            timestamps = cached['timestamps']
+            if timestamps.dtype != np.dtype('datetime64[ns]'):
+                return None
+            return {
+                'timestamps': timestamps,
+                'offset': int(cached['offset']),
+                'tail': cached['tail'].tobytes(),
+                'size': int(cached['size']),
+                'mtime_ns': int(cached['mtime_ns']),
+            }
+    except (OSError, EOFError, ValueError, TypeError, KeyError, zipfile.BadZipFile):
+        return None
+
+
+def _save_cache(path, timestamps, offset, tail, st):
+    """Cache the timestamps parsed from the first `offset` bytes of a transcript."""
+    cache_path = _cache_path(path)
+    tmp_path = cache_path.with_suffix('.tmp')
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, version=_CACHE_VERSION, timestamps=timestamps, offset=offset,
+                     tail=np.frombuffer(tail, dtype=np.uint8),
+                     size=st.st_size, mtime_ns=st.st_mtime_ns)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # Caching is best-effort
+
+
+def _sorted(timestamps):
+    """Sort a datetime64 array in place if needed and return it."""
+    # Transcripts are append-only, so a sort is only needed if a line is out of order
+    if not (timestamps[1:] >= timestamps[:-1]).all():
+        timestamps.sort()
+    return timestamps
+
+
+def _days_from_civil(y, m, d):
+    """Days since 1970-01-01 for a proleptic Gregorian date."""
+    if m <= 2:
+        y -= 1
+    era = y // 400
+    yoe = y - era * 400
+    doy = (153 * (m - 3 if m > 2 else m + 9) + 2) // 5 + d - 1
+    doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+    return era * 146097 + doe - 719468
+
+
+def _iso_to_ns(buf, s, e):
+    """Parse buf[s:e] as YYYY-MM-DDTHH:MM:SS[.fff...][Z] into ns since the epoch.
+
+    Returns (ns, ok); ok is False for anything outside that format.
+    """
+    if e - s < 19:
+        return 0, False
+    for q in (0, 1, 2, 3, 5, 6, 8, 9, 11, 12, 14, 15, 17, 18):
+        if buf[s + q] < 48 or buf[s + q] > 57:
+            return 0, False
+    if (buf[s + 4] != 45 or buf[s + 7] != 45 or (buf[s + 10] != 84 and buf[s + 10] != 32)
+            or buf[s + 13] != 58 or buf[s + 16] != 58):
+        return 0, False
+
+    def num(q, width):
+        v = 0
+        for r in range(width):
+            v = v * 10 + (buf[s + q + r] - 48)
+        return v
+
+    year, month, day = num(0, 4), num(5, 2), num(8, 2)
+    hour, minute, second = num(11, 2), num(14, 2), num(17, 2)
+    if month < 1 or month > 12 or day < 1 or day > _DAYS_IN_MONTH[month - 1]:
+        return 0, False
+    if month == 2 and day == 29 and (year % 4 != 0 or (year % 100 == 0 and year % 400 != 0)):
+        return 0, False
+    if hour > 23 or minute > 59 or second > 59:
+        return 0, False
+
+    p = s + 19
+    frac = 0
+    if p < e and buf[p] == 46:  # '.'
+        p += 1
+        scale = 100000000
+        digits = 0
+        while p < e and 48 <= buf[p] <= 57:
+            frac += (buf[p] - 48) * scale  # digits past nanoseconds are dropped
+            scale //= 10
+            digits += 1
+            p += 1
+        if digits == 0:
+            return 0, False
+    if p < e and buf[p] == 90:  # 'Z'
+        p += 1
+    if p != e:
+        return 0, False
+
+    days = _days_from_civil(year, month, day)
+    return (days * 86400 + hour * 3600 + minute * 60 + second) * 1000000000 + frac, True
+
+
+def _parse_iso_ns(buf, key):
+    """Scan JSONL bytes for each line's top-level timestamp field, as int64 ns.
+
+    Mirrors _TS_RE and _is_top_level. Values outside the strict format (e.g.
+    a UTC offset) are not parsed here; their (start, end) offsets in buf are
+    returned in bad for the general parser.
+    """
+    n = len(buf)
+    k_len = len(key)
+    # At most one timestamp per line
+    lines = 1
+    for i in range(n):
+        if buf[i] == 10:
+            lines += 1
+    out = np.empty(lines, dtype=np.int64)
+    bad = np.empty((lines, 2), dtype=np.int64)
+    count = 0
+    n_bad = 0
+    i = 0
+    while i < n:
+        j = i
+        while j < n and buf[j] != 10:
+            j += 1
+        depth = 0
+        p = i
+        while p < j:
+            c = buf[p]
+            if c == 34:  # '"' opens a string, possibly a key
+                if depth == 1 and p + k_len <= j:
+                    matched = True
+                    for q in range(k_len):
+                        if buf[p + q] != key[q]:
+                            matched = False
+                            break
+                    v = w = 0
+                    if matched:
+                        r = p + k_len
+                        while r < j and (buf[r] == 32 or buf[r] == 9 or buf[r] == 13):
+                            r += 1
+                        if r < j and buf[r] == 58:  # ':'
+                            r += 1
+                            while r < j and (buf[r] == 32 or buf[r] == 9 or buf[r] == 13):
+                                r += 1
+                            if r < j and buf[r] == 34:
+                                v = w = r + 1
+                                while w < j and buf[w] != 34:
+                                    w += 1
+                    if w < j and w > v:
+                        ns, ok = _iso_to_ns(buf, v, w)
+                        if ok:
+                            out[count] = ns
+                            count += 1
+                        else:
+                            bad[n_bad, 0] = v
+                            bad[n_bad, 1] = w
+                            n_bad += 1
+                        break
+                # Skip over the string, honoring escapes
+                p += 1
+                while p < j and buf[p] != 34:
+                    if buf[p] == 92:
+                        p += 1
+                    p += 1
+            elif c == 123 or c == 91:  # '{' or '['
+                depth += 1
+            elif c == 125 or c == 93:  # '}' or ']'
+                depth -= 1
+            p += 1
+        i = j + 1
+    return out[:count], bad[:n_bad]
+
+
+if njit is not None:
+    _days_from_civil = njit(cache=True)(_days_from_civil)
+    _iso_to_ns = njit(cache=True)(_iso_to_ns)
+    _parse_iso_ns = njit(cache=True)(_parse_iso_ns)
+
+
+def _depth_change(segment):
+    """Net JSON nesting change across a segment that starts outside a string."""
+    # Drop string contents first so braces inside messages don't count
+    segment = _JSON_STR_RE.sub(b'', segment)
+    return (segment.count(b'{') + segment.count(b'[')
+            - segment.count(b'}') - segment.count(b']'))
+
+
+def _cast_naive_iso(values):
+    """Parse naive-ISO byte strings with NumPy's ISO parser.
+
+    Returns (parsed, invalid): well-formed but impossible values (e.g. Feb 30)
+    fail the whole cast, so failing batches are split in half until those
+    values are isolated; they are returned for the general parser.
+    """
+    try:
+        # The cast goes through str: a failing bytes -> datetime64 cast of a
+        # large array crashes NumPy 2.x instead of raising
+        return np.array(values, dtype='S').astype('U').astype('datetime64[ns]'), []
+    except ValueError:
+        if len(values) == 1:
+            return np.array([], dtype='datetime64[ns]'), values
+    mid = len(values) // 2
+    head, head_invalid = _cast_naive_iso(values[:mid])
+    rest, rest_invalid = _cast_naive_iso(values[mid:])
+    return np.concatenate([head, rest]), head_invalid + rest_invalid
+
+
+def _scan_timestamps(buf, start, end):
+    """Parse the timestamps of the JSONL lines in buf[start:end]."""
+    if njit is not None and end - start > _NUMBA_MIN_BYTES:
+        ns, bad = _parse_iso_ns(np.frombuffer(buf, dtype=np.uint8)[start:end], _TS_KEY)
+        parsed = ns.view('datetime64[ns]')
+        slow = [buf[start + s:start + e] for s, e in bad]
+    else:
+        fast, slow = [], []
+        # Nesting depth is tracked incrementally from the previous key on the
+        # same line, so each line is stripped and counted at most once. Every
+        # match starts on the quote of a key, i.e. outside any string.
+        pos = line_end = start
+        depth = depth_pos = 0
+        while True:
+            m = _TS_RE.search(buf, pos, end)
+            if m is None:
+                break
+            key_pos = m.start()
+            if key_pos >= line_end:
+                line_start = max(start, buf.rfind(b'\n', start, key_pos) + 1)
+                line_end = buf.find(b'\n', key_pos, end)
+                if line_end < 0:
+                    line_end = end
+                depth, depth_pos = 0, line_start
+            depth += _depth_change(buf[depth_pos:key_pos])
+            depth_pos = key_pos
+            if depth == 1:
+                value = m.group(1)
+                (fast if _NAIVE_ISO_RE.fullmatch(value) else slow).append(value)
+                pos = line_end  # one timestamp per line
+            else:
+                pos = m.end()
+
+        parsed, invalid = _cast_naive_iso(fast)
+        slow += invalid
+
+    if not slow:
+        return parsed
+
+    # Values outside the naive-ISO format, such as UTC offsets
     timestamps = []
-    path = Path(str(path).replace("~", str(Path.home())))
+    for ts_bytes in slow:
+        ts = parse_timestamp(ts_bytes.decode('ascii', 'replace'))
+        if ts:
+            timestamps.append(ts)
+    return np.concatenate([parsed, np.array(timestamps, dtype='datetime64[ns]')])
 
-    if not path.exists():
-        print(f"    Warning: {path} not found")
-        return timestamps
 
-    with open(path, 'r') as f:
-        for line in f:
-            try:
-                data = json.loads(line)
-                # Get timestamp from top level
-                if 'timestamp' in data and data['timestamp']:
-                    ts = parse_timestamp(data['timestamp'])
-                    if ts:
-                        timestamps.append(ts)
-            except json.JSONDecodeError:
-                continue
-            except Exception:
-                continue
+def extract_timestamps(path):
+    """Extract all timestamps from a JSONL transcript file as a datetime64[ns] array."""
+    empty = np.array([], dtype='datetime64[ns]')
+    path = Path(path).expanduser()
 
-    return sorted(timestamps)
+    if not path.exists():
+        print(f"    Warning: {path} not found")
+        return empty
+
+    st = path.stat()
+    if st.st_size == 0:
+        return empty
+
+    cached = _load_cache(path)
+    if (cached is not None and cached['offset'] == st.st_size
+            and cached['size'] == st.st_size and cached['mtime_ns'] == st.st_mtime_ns):
+        return cached['timestamps']
+
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Reuse the cached prefix if the file grew (appends always change the
+            # size) or is unchanged, and still ends the prefix with the same bytes.
+            # A same-size file with a new mtime was rewritten, so reparse it.
+            prefix, start = empty, 0
+            if cached is not None and (
+                    st.st_size > cached['size']
+                    or (st.st_size == cached['size'] and st.st_mtime_ns == cached['mtime_ns'])):
+                offset, tail = cached['offset'], cached['tail']
+                if len(tail) <= offset <= st.st_size and mm[offset - len(tail):offset] == tail:
+                    prefix, start = cached['timestamps'], offset
+
+            # Only complete lines are cached; a trailing partial line is parsed
+            # but left for the next run
+            end = mm.rfind(b'\n') + 1
+            complete = _sorted(np.concatenate(
+                [prefix, _scan_timestamps(mm, start, max(start, end))]))
+            if end > start:
+                _save_cache(path, complete, end,
+                            mm[max(0, end - _CACHE_CHECK_BYTES):end], st)
+            partial = _scan_timestamps(mm, max(start, end), st.st_size)
+
+    if not len(partial):
+        return complete
+    return _sorted(np.concatenate([complete, partial]))
 
 
 def create_activity_plot(sessions_data, output_path, title="Session Activity Timeline"):
     """Create activity timeline visualization."""
     fig, ax = plt.subplots(figsize=(16, 8))
 
-    # Collect all timestamps to determine time range
-    all_timestamps = []
+    # Drop empty sessions and unknown types up front; everything below can
+    # assume non-empty arrays
+    populated = {}
     for name, data in sessions_data.items():
-        all_timestamps.extend(data['timestamps'])
-
-    if not all_timestamps:
+        if data['type'] not in SESSION_TYPES:
+            print(f"  Warning: skipping {name}: unknown session type {data['type']!r}")
+        elif len(data['timestamps']):
+            populated[name] = data
+    if not populated:
         print("No timestamps found!")
         return
 
-    min_time = min(all_timestamps)
-    max_time = max(all_timestamps)
-
-    # Sort sessions by start time within each type
-    def get_start_time(name):
-        ts = sessions_data[name]['timestamps']
-        return min(ts) if ts else datetime.max
+    # One pass over the sessions, ordered by section and by start time within it
+    meta = [SessionMeta(name, d['type'], d['timestamps'], d['timestamps'][0], d['timestamps'][-1])
+            for name, d in populated.items()]
+    meta.sort(key=lambda m: (SESSION_TYPES.index(m.type), m.start))
 
-    claude_sessions = sorted(
-        [n for n, d in sessions_data.items() if d['type'] == 'claude'],
-        key=get_start_time
-    )
-    codex_sessions = sorted(
-        [n for n, d in sessions_data.items() if d['type'] == 'codex'],
-        key=get_start_time
-    )
+    min_time = min(m.start for m in meta)
+    max_time = max(m.end for m in meta)
+    # Padding leaves room for the section and session labels
+    x_min = min_time - np.timedelta64(60, 'm')
+    x_max = max_time + np.timedelta64(90, 'm')
 
     # Create y-positions for each session (bottom to top within each section)
-    y_positions = {}
-    y = 1
-    for name in codex_sessions:
-        y_positions[name] = y
-        y += 1
-    y += 0.5  # Gap between sections
-    divider_y = y - 0.25
-    for name in claude_sessions:
-        y_positions[name] = y
-        y += 1
-
-    # Plot activity for each session
-    for name, data in sessions_data.items():
-        timestamps = data['timestamps']
-        if not timestamps:
-            continue
-
-        y_pos = y_positions[name]
-        color = CLAUDE_COLOR if data['type'] == 'claude' else CODEX_COLOR
-
-        # Plot individual events as small vertical lines
-        for ts in timestamps:
-            ax.plot([ts, ts], [y_pos - 0.35, y_pos + 0.35],
-                   color=color, alpha=0.6, linewidth=0.5)
-
-        # Add density plot (activity intensity)
+    num_codex = sum(1 for m in meta if m.type == 'codex')
+    y_positions = np.arange(1, len(meta) + 1, dtype=np.float64)
+    y_positions[num_codex:] += 0.5  # Gap between sections
+    divider_y = num_codex + 1.25
+    colors = [CLAUDE_COLOR if m.type == 'claude' else CODEX_COLOR for m in meta]
+
+    # Plot individual events of all sessions as small vertical lines in one call.
+    # Busy sessions are thinned to a few lines per pixel column, since extra
+    # lines in the same column would only overdraw each other.
+    x0, x1 = mdates.date2num(x_min), mdates.date2num(x_max)
+    width_px = fig.get_figwidth() * PNG_DPI * LINES_PER_PIXEL
+    session_xs = []
+    for m in meta:
+        x = mdates.date2num(m.timestamps)
+        if len(x) > width_px:
+            px_idx = ((x - x0) / (x1 - x0) * width_px).astype(np.int32)
+            x = x[np.unique(px_idx, return_index=True)[1]]
+        session_xs.append(x)
+    counts = [len(x) for x in session_xs]
+    xs = np.concatenate(session_xs)
+    ys = np.repeat(y_positions, counts)
+    cs = np.repeat([to_rgba(c) for c in colors], counts, axis=0)
+    ax.vlines(xs, ys - 0.35, ys + 0.35, colors=cs, alpha=0.6, linewidths=0.5)
+
+    # Add density plot (activity intensity) for each session
+    for m, y_pos, color in zip(meta, y_positions, colors):
+        timestamps, start = m.timestamps, m.start
         if len(timestamps) > 1:
-            time_range = (max(timestamps) - min(timestamps)).total_seconds()
-            if time_range > 0:
-                bin_minutes = max(1, int(time_range / 60 / 30))  # ~30 bins
-                bins = max(10, int(time_range / 60 / bin_minutes) + 1)
+            minutes = (timestamps - start).astype('timedelta64[s]').astype(np.float64) / 60.0
+            span = minutes[-1]
+            if span > 0:
+                bins = max(MIN_BINS, min(TARGET_BINS, int(span)))
 
-                start = min(timestamps)
-                minutes = [(t - start).total_seconds() / 60 for t in timestamps]
-
-                hist, edges = np.histogram(minutes, bins=bins)
+                # Uniform bins over [0, span]: scale to integer bin indices and count
+                idx = (minutes * (bins / span)).astype(np.intp)
+                np.clip(idx, 0, bins - 1, out=idx)
+                hist = np.bincount(idx, minlength=bins)
+                edges = np.linspace(0, span, bins + 1)
 
                 if hist.max() > 0:
+                    # One rectangle per non-empty bin, drawn as a single collection
                     hist_norm = hist / hist.max() * 0.3
-                    for i in range(len(hist)):
-                        if hist[i] > 0:
-                            t_start = start + np.timedelta64(int(edges[i]), 'm')
-                            t_end = start + np.timedelta64(int(edges[i+1]), 'm')
-                            ax.fill_between(
-                                [t_start, t_end],
-                                [y_pos - hist_norm[i], y_pos - hist_norm[i]],
-                                [y_pos + hist_norm[i], y_pos + hist_norm[i]],
-                                color=color, alpha=0.4
-                            )
+                    mask = hist > 0
+                    # Bin edges as timestamps (whole minutes), converted in one go
+                    edges_td = edges.astype(np.int64).astype('timedelta64[m]')
+                    edge_x = mdates.date2num(start + edges_td)
+                    t_starts = edge_x[:-1][mask]
+                    t_ends = edge_x[1:][mask]
+                    y0 = y_pos - hist_norm[mask]
+                    y1 = y_pos + hist_norm[mask]
+                    verts = np.stack([
+                        np.column_stack([t_starts, y0]),
+                        np.column_stack([t_ends, y0]),
+                        np.column_stack([t_ends, y1]),
+                        np.column_stack([t_starts, y1]),
+                    ], axis=1)
+                    ax.add_collection(PolyCollection(
+                        verts, facecolors=color, alpha=0.4, linewidths=0))
 
     # Add session labels on the right side
-    for name, data in sessions_data.items():
-        timestamps = data['timestamps']
-        if not timestamps:
-            continue
-        y_pos = y_positions[name]
-        color = CLAUDE_COLOR if data['type'] == 'claude' else CODEX_COLOR
-        ax.text(max_time + np.timedelta64(5, 'm'), y_pos, name,
+    for m, y_pos, color in zip(meta, y_positions, colors):
+        ax.text(max_time + np.timedelta64(5, 'm'), y_pos, m.name,
                fontsize=9, fontweight='bold', color=color, va='center')
 
     # Add section divider and labels
     ax.axhline(y=divider_y, color='gray', linestyle='--', alpha=0.4, linewidth=1)
-    ax.text(min_time - np.timedelta64(5, 'm'), y - 0.5, 'Claude Code',
+    ax.text(min_time - np.timedelta64(5, 'm'), len(meta) + 1, 'Claude Code',
            fontsize=11, fontweight='bold', color='#6366f1', ha='right', va='center')
-    ax.text(min_time - np.timedelta64(5, 'm'), len(codex_sessions) / 2 + 0.5, 'Codex',
+    ax.text(min_time - np.timedelta64(5, 'm'), num_codex / 2 + 0.5, 'Codex',
            fontsize=11, fontweight='bold', color='#f97316', ha='right', va='center')
 
     # Format axes
@@ -227,10 +573,12 @@ def create_activity_plot(sessions_data, output_path, title="Session Activity Tim
 
     plt.xticks(rotation=0)
     # Dynamic date label
-    date_str = min_time.strftime('%b %d')
-    if min_time.date() != max_time.date():
-        date_str = f"{min_time.strftime('%b %d')}-{max_time.strftime('%d')}"
-    ax.set_xlabel(f'Time (UTC) — {date_str}, {min_time.year}', fontsize=11)
+    min_dt = min_time.astype('datetime64[us]').item()
+    max_dt = max_time.astype('datetime64[us]').item()
+    date_str = min_dt.strftime('%b %d')
+    if min_dt.date() != max_dt.date():
+        date_str = f"{min_dt.strftime('%b %d')}-{max_dt.strftime('%d')}"
+    ax.set_xlabel(f'Time (UTC) — {date_str}, {min_dt.year}', fontsize=11)
     ax.set_ylabel('')
     ax.set_title(f'{title}\nActual message/event activity (vertical lines = events, shading = intensity)',
                 fontsize=13, fontweight='bold', pad=15)
@@ -239,9 +587,8 @@ def create_activity_plot(sessions_data, output_path, title="Session Activity Tim
     ax.set_yticks([])
 
     # Set limits with padding for labels
-    ax.set_xlim(min_time - np.timedelta64(60, 'm'),
-               max_time + np.timedelta64(90, 'm'))
-    ax.set_ylim(0.3, len(sessions_data) + 1.5)
+    ax.set_xlim(x_min, x_max)
+    ax.set_ylim(0.3, len(meta) + 1.5)
 
     # Add grid
     ax.grid(True, axis='x', alpha=0.3, linestyle='-')
@@ -255,13 +602,18 @@ def create_activity_plot(sessions_data, output_path, title="Session Activity Tim
     ax.legend(handles=legend_elements, loc='upper right', framealpha=0.9)
 
     plt.tight_layout()
-    plt.savefig(output_path, dpi=150, bbox_inches='tight',
+    # Compute the tight bounding box once and reuse it for both outputs
+    # (padded the same way bbox_inches='tight' pads it)
+    fig.canvas.draw()
+    bbox = fig.get_tightbbox(fig.canvas.get_renderer()).padded(
+        plt.rcParams['savefig.pad_inches'])
+    plt.savefig(output_path, dpi=PNG_DPI, bbox_inches=bbox,
                facecolor='white', edgecolor='none')
     print(f"Saved: {output_path}")
 
     # Also save as SVG for the markdown
     svg_path = output_path.with_suffix('.svg')
-    plt.savefig(svg_path, format='svg', bbox_inches='tight',
+    plt.savefig(svg_path, format='svg', bbox_inches=bbox,
                facecolor='white', edgecolor='none')
     print(f"Saved: {svg_path}")
 
@@ -301,11 +653,15 @@ def main():
 
     print("Extracting timestamps from transcripts...")
 
+    # Each transcript is parsed independently, so fan out across processes
+    with ProcessPoolExecutor() as ex:
+        results = dict(zip(sessions, ex.map(
+            extract_timestamps, [info['path'] for info in sessions.values()])))
+
     sessions_data = {}
     for name, info in sessions.items():
-        print(f"  Processing {name}...")
-        timestamps = extract_timestamps(info['path'])
-        print(f"    Found {len(timestamps)} events")
+        timestamps = results[name]
+        print(f"  {name}: found {len(timestamps)} events")
         sessions_data[name] = {
             'timestamps': timestamps,
             'type': info['type'],